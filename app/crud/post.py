@@ -1,7 +1,7 @@
 from uuid import UUID
 
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.exceptions import (
     PermissionDeniedError,
@@ -68,7 +68,13 @@ def get_published_posts(
     Returns:
         tuple[list[Post], int]: 已发布文章分页查询列表和数据总数
     """
-    query = select(Post).where(Post.status == PostStatus.PUBLISHED)
+    # 预加载 author 和 tags，避免序列化每篇文章时触发 N+1 懒加载查询
+    # selectinload 用 IN 子查询批量加载，多对多的 tags 不会产生笛卡尔积
+    query = (
+        select(Post)
+        .options(selectinload(Post.author), selectinload(Post.tags))
+        .where(Post.status == PostStatus.PUBLISHED)
+    )
 
     # 应用过滤条件
     if filters_params:
@@ -130,6 +136,7 @@ def get_featured_posts(
     """分页获取置顶文章列表"""
     query = (
         select(Post)
+        .options(selectinload(Post.author), selectinload(Post.tags))
         .where(Post.status == PostStatus.PUBLISHED, Post.is_featured.is_(True))
         .order_by(Post.published_at.desc())
     )
@@ -176,8 +183,12 @@ def create_post(db: Session, *, post_in: PostCreate, author_id: UUID) -> Post:
 
     # 7. 一次性提交事务，保证事务完整性。
     db.commit()
-    db.refresh(post)
-    return post
+
+    # 8. 带着标签集合重新取回：调用方（API 序列化）紧接着就会访问
+    # post.tags，selectinload 预加载可以避免再触发一次懒加载 SELECT
+    return db.execute(
+        select(Post).options(selectinload(Post.tags)).where(Post.id == post.id)
+    ).scalar_one()
 
 
 # ============================= 文章更新函数 ===========================
@@ -226,9 +237,11 @@ def update_post(
     # 7. 统一提交（一次性提交所有修改，确保事务原子性）
     db.add(post)
     db.commit()
-    db.refresh(post)
 
-    return post
+    # 8. 同 create_post：预加载标签集合，省去调用方的懒加载 SELECT
+    return db.execute(
+        select(Post).options(selectinload(Post.tags)).where(Post.id == post.id)
+    ).scalar_one()
 
 
 def publish_post(db: Session, *, post_id: UUID, user_id: UUID) -> Post:
@@ -9,63 +9,73 @@ import uuid
 from collections.abc import Callable, Generator
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import cache
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import ConnectionPoolEntry
+from sqlalchemy.pool import ConnectionPoolEntry, StaticPool
 
-import app.crud.post as post_crud
 from app.core.security import create_access_token
 from app.crud import comment as comment_crud
 from app.crud import follow as follow_crud
+from app.crud import tag as tag_crud
 from app.db.database import Base
 from app.models import Comment, Post, PostView, User
 from app.models.notification import Notification
 from app.models.post import PostStatus
+from app.models.tag import Tag
 from app.models.user import UserRole
 from app.schemas.comment import CommentCreate
-from app.schemas.post import PostCreate
 
 # ============================================
 # 数据库相关 Fixture
 # ============================================
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def engine() -> Generator[Engine, None, None]:
     """创建测试数据库引擎（内存 SQLite 数据库）
 
     配置：
-    - 使用内存数据库，速度快，测试隔离
+    - 使用内存数据库，速度快，commit 只是内存写入
     - StaticPool 确保所有连接使用同一个内存数据库
     - 自动启用 SQLite 外键约束（默认关闭）
-    - 每个测试函数独立的数据库实例
+    - session 级作用域：整个测试会话只建表一次，
+      测试间隔离由 session fixture 的事务回滚保证
 
     Returns:
         Engine: SQLAlchemy 数据库引擎
     """
     # 创建内存数据库引擎，使用 StaticPool 确保单一连接
-    from sqlalchemy.pool import StaticPool
-
     engine = create_engine(
-        "sqlite:///:memory:",
+        "sqlite://",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,  # 关键：使用 StaticPool 确保所有会话共享同一个连接
+        query_cache_size=500,  # 编译语句缓存（2.x 默认开启，这里显式声明）
     )
 
     # 启用 SQLite 外键约束（必须在 create_all() 之前）
+    # 同时禁用 pysqlite 驱动的隐式事务管理（isolation_level=None），
+    # 否则 SAVEPOINT / 嵌套事务无法正常回滚
+    # 参考: SQLAlchemy 文档 "Serializable isolation / Savepoints / Transactional DDL"
     @event.listens_for(engine, "connect")
     def set_sqlite_pragma(
         dbapi_conn: sqlite3.Connection, _connection_record: ConnectionPoolEntry
     ) -> None:
         """每次建立连接时自动启用外键约束"""
+        dbapi_conn.isolation_level = None
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
 
-    # 创建所有表
+    @event.listens_for(engine, "begin")
+    def do_begin(conn) -> None:
+        """由 SQLAlchemy 显式发出 BEGIN，保证事务边界可控"""
+        conn.exec_driver_sql("BEGIN")
+
+    # 创建所有表（整个测试会话只执行一次）
     Base.metadata.create_all(engine)
 
     yield engine
@@ -80,8 +90,10 @@ def session(engine: Engine) -> Generator[Session, None, None]:
     """创建测试数据库会话
 
     配置：
-    - 每个测试函数独立的会话
-    - 测试结束后自动回滚，保证测试隔离
+    - 每个测试函数独立的会话，包裹在一个外层事务中
+    - join_transaction_mode="create_savepoint" 让测试内的 commit()
+      变成 SAVEPOINT，外层事务在测试结束后整体回滚
+    - 回滚是 O(微秒) 级操作，测试间隔离无需重建表
 
     Args:
         engine: 数据库引擎 fixture
@@ -89,15 +101,24 @@ def session(engine: Engine) -> Generator[Session, None, None]:
     Returns:
         Session: SQLAlchemy 数据库会话
     """
-    # 将引擎绑定到 sessionmaker
-    testing_session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # 外层事务：测试内所有 commit 都变成嵌套的 SAVEPOINT
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    testing_session_local = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+    )
     session = testing_session_local()
 
     yield session
 
-    # 清理：回滚未提交的事务并关闭会话
-    session.rollback()
+    # 清理：关闭会话并整体回滚外层事务，恢复到空库状态
     session.close()
+    transaction.rollback()
+    connection.close()
 
 
 # ============================================
@@ -105,6 +126,52 @@ def session(engine: Engine) -> Generator[Session, None, None]:
 # ============================================
 
 
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing() -> Generator[None, None, None]:
+    """测试会话期间降低 bcrypt 成本因子（rounds 12 → 4）
+
+    bcrypt rounds=12 单次哈希约 0.1-0.2 秒，是用户类 fixture 的主要开销。
+    完全替换哈希器会破坏 test_security 对 bcrypt 格式和验证语义的断言，
+    因此保留真实 bcrypt，只把迭代成本降到库允许的最小值（4）。
+    hash_password / verify_password 的行为和哈希格式 $2b$04$... 均不变。
+    """
+    import bcrypt
+
+    original_gensalt = bcrypt.gensalt
+
+    def _fast_gensalt(rounds: int = 12, prefix: bytes = b"2b") -> bytes:
+        return original_gensalt(rounds=4, prefix=prefix)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(bcrypt, "gensalt", _fast_gensalt)
+        yield
+
+
+@cache
+def _cached_password_hash(plain_password: str) -> str:
+    """缓存 bcrypt 哈希：同一明文密码整个测试会话只计算一次
+
+    bcrypt 单次哈希约 50ms 以上，fixture 每个测试重建用户时
+    重复哈希相同的明文密码是纯浪费。fixture 本身受 SAVEPOINT
+    回滚约束无法提升作用域，但哈希结果可以安全复用。
+    """
+    from app.core.security import hash_password
+
+    return hash_password(plain_password)
+
+
+@pytest.fixture(scope="session")
+def known_password_hash(fast_password_hashing: None) -> tuple[str, str]:
+    """会话级 (明文密码, bcrypt 哈希) 对
+
+    供只需要"一个已知密码及其哈希"的测试复用，
+    避免每个测试各自重新计算一次 bcrypt。
+    需要验证 salt 唯一性或哈希格式的测试仍应自己调用 hash_password。
+    """
+    password = "TestPassword123"
+    return password, _cached_password_hash(password)
+
+
 @pytest.fixture
 def sample_user(session: Session) -> User:
     """创建测试用户
@@ -151,13 +218,11 @@ def sample_user_with_password(session: Session) -> tuple[User, str]:
         ...     user, plain_password = sample_user_with_password
         ...     # plain_password 是 "TestPassword123!"
     """
-    from app.core.security import hash_password
-
     plain_password = "TestPassword123!"
     user = User(
         username=f"testuser_{uuid.uuid4().hex[:8]}",
         email=f"test_{uuid.uuid4().hex[:8]}@example.com",
-        password_hash=hash_password(plain_password),  # 使用真实的 bcrypt 哈希
+        password_hash=_cached_password_hash(plain_password),  # 真实 bcrypt 哈希（缓存）
         nickname="Test User",
     )
     session.add(user)
@@ -339,6 +404,30 @@ def sample_user_data() -> Callable[[], dict[str, str]]:
     return _factory
 
 
+@pytest.fixture
+def make_users(
+    session: Session, sample_user_data: Callable[[], dict[str, str]]
+) -> Callable[[int], list[User]]:
+    """批量创建 n 个一次性用户的工厂函数
+
+    替代测试里反复出现的 "逐个 User(**sample_user_data()) +
+    add_all + commit" 样板：一次 add_all、一次 commit 落库。
+    用户数据来自 sample_user_data（占位哈希，无 bcrypt 开销）。
+
+    Example:
+        >>> def test_followers(make_users):
+        ...     follower_one, follower_two = make_users(2)
+    """
+
+    def _factory(n: int) -> list[User]:
+        users = [User(**sample_user_data()) for _ in range(n)]
+        session.add_all(users)
+        session.commit()
+        return users
+
+    return _factory
+
+
 @pytest.fixture
 def sample_post_data(sample_user: User) -> Callable[[], dict[str, str | uuid.UUID]]:
     """生成唯一的文章数据字典的工厂函数
@@ -377,26 +466,67 @@ def sample_post_data(sample_user: User) -> Callable[[], dict[str, str | uuid.UUI
 # ============================================
 
 
-@pytest.fixture(scope="function")
-def client(session) -> Generator[TestClient, None, None]:
-    """创建测试客户端，并覆盖 get_db 依赖
+# 当前测试正在使用的数据库会话（由 client fixture 注入，供 get_db 覆盖读取）
+_active_session: Session | None = None
 
-    注意：
-    - 使用 engine 创建独立的 session factory
-    - 每次请求都会创建新的 session
-    - engine 已经创建了所有表
+
+def _override_get_db() -> Generator[Session, None, None]:
+    """get_db 依赖覆盖：返回当前测试的 session"""
+    assert _active_session is not None, "client fixture 尚未注入测试会话"
+    yield _active_session
+
+
+@pytest.fixture(scope="session")
+def app_client() -> Generator[TestClient, None, None]:
+    """session 级 TestClient：整个测试会话只构建一次 ASGI 应用和客户端
+
+    TestClient 的构建会执行 lifespan 启动/关闭事件并重建依赖图，
+    每个测试重复一次开销很大。这里只构建一次，get_db 覆盖通过
+    模块级 _active_session 间接读取当前测试的 session。
+
+    lifespan 被替换为空实现：启动时的通知清理任务会连接真实数据库，
+    对测试而言是纯开销（且在 CI 上必然失败后静默吞掉异常）。
     """
+    from contextlib import asynccontextmanager
+
     from app.api.deps import get_db
     from app.main import app
 
-    # 覆盖依赖
-    app.dependency_overrides[get_db] = lambda: session
+    @asynccontextmanager
+    async def _noop_lifespan(app_):
+        yield
+
+    original_lifespan = app.router.lifespan_context
+    app.router.lifespan_context = _noop_lifespan
+    app.dependency_overrides[get_db] = _override_get_db
 
     with TestClient(app) as test_client:
         yield test_client
 
-    # 清理覆盖
     app.dependency_overrides.clear()
+    app.router.lifespan_context = original_lifespan
+
+
+@pytest.fixture(scope="function")
+def client(
+    app_client: TestClient, session: Session
+) -> Generator[TestClient, None, None]:
+    """创建测试客户端，并覆盖 get_db 依赖
+
+    注意：
+    - 复用 session 级的 TestClient，仅按测试切换 get_db 指向的会话
+    - 重新安装覆盖，防止其他测试（如 test_deps）清空 dependency_overrides
+    """
+    from app.api.deps import get_db
+    from app.main import app
+
+    global _active_session
+    _active_session = session
+    app.dependency_overrides[get_db] = _override_get_db
+
+    yield app_client
+
+    _active_session = None
 
 
 @pytest.fixture
@@ -425,8 +555,6 @@ def sample_users(session: Session, sample_user: User) -> list[User]:
     - 作为文章和评论的作者
     - 创建sample_follows测试数据
     """
-    from app.core.security import hash_password
-
     users = [sample_user]
     user_templates = [
         {"username": "zhangsan", "email": "zhangsan@example.com", "nickname": "张三"},
@@ -438,7 +566,7 @@ def sample_users(session: Session, sample_user: User) -> list[User]:
         user = User(
             username=template["username"],
             email=template["email"],
-            password_hash=hash_password("testpassword123"),
+            password_hash=_cached_password_hash("testpassword123"),
             nickname=template["nickname"],
         )
         session.add(user)
@@ -451,6 +579,71 @@ def sample_users(session: Session, sample_user: User) -> list[User]:
     return users
 
 
+# sample_posts 的静态数据模板：模块级常量，整个测试会话只构建一次
+# 4个published文章 + 2个draft文章 + 1个archived文章
+_SAMPLE_POST_TEMPLATES = [
+    # 已发布的文章
+    {
+        "title": "Python 入门教程",
+        "content": "Python 是一门简单易学的编程语言...",
+        "summary": "Python 基础语法介绍",
+        "tags": ["Python", "教程"],
+        "status": PostStatus.PUBLISHED,
+        "published_at_offset": None,  # 25天前发布
+    },
+    {
+        "title": "FastAPI 快速开发指南",
+        "content": "FastAPI 是现代 Python Web 框架...",
+        "summary": "FastAPI 核心特性介绍",
+        "tags": ["FastAPI", "Web开发"],
+        "status": PostStatus.PUBLISHED,
+        "published_at_offset": -20,
+    },
+    {
+        "title": "Web 开发最佳实践",
+        "content": "现代 Web 开发需要考虑很多因素...",
+        "summary": "Web 开发经验总结",
+        "tags": ["Web开发", "实战"],
+        "status": PostStatus.PUBLISHED,
+        "published_at_offset": -15,
+    },
+    {
+        "title": "Python 数据分析实战",
+        "content": "使用 Python 进行数据分析...",
+        "summary": "数据分析项目实战",
+        "tags": ["Python", "实战"],
+        "status": PostStatus.PUBLISHED,
+        "published_at_offset": -10,
+    },
+    # 归档文章
+    {
+        "title": "FastAPI 性能优化技巧",
+        "content": "如何优化 FastAPI 应用性能...",
+        "summary": "性能优化经验分享",
+        "tags": ["FastAPI", "性能"],
+        "status": PostStatus.ARCHIVED,
+        "published_at_offset": -5,
+    },
+    # 草稿文章
+    {
+        "title": "Django vs FastAPI 对比",
+        "content": "Django 和 FastAPI 的详细对比...",
+        "summary": "框架对比分析",
+        "tags": ["Django", "FastAPI"],
+        "status": PostStatus.DRAFT,
+        "published_at_offset": -1,
+    },
+    {
+        "title": "Python 异步编程详解",
+        "content": "深入理解 Python 异步编程...",
+        "summary": "异步编程概念解析",
+        "tags": ["Python", "异步"],
+        "status": PostStatus.DRAFT,
+        "published_at_offset": None,
+    },
+]
+
+
 @pytest.fixture
 def sample_posts(session: Session, sample_user: User) -> list[Post]:
     """创建多样化的测试文章数据
@@ -461,97 +654,44 @@ def sample_posts(session: Session, sample_user: User) -> list[Post]:
     - 不同发布状态（已发布、草稿、 归档）
     - 不同发布时间（分散在最近30天内）
     - 不同标题内容（便于测试模糊搜索）
-    """
 
-    # 定义测试数据模板
-    post_templates = [
-        # 已发布的文章
-        {
-            "title": "Python 入门教程",
-            "content": "Python 是一门简单易学的编程语言...",
-            "summary": "Python 基础语法介绍",
-            "tags": ["Python", "教程"],
-            "status": PostStatus.PUBLISHED,
-            "published_at_offset": None,  # 25天前发布
-        },
-        {
-            "title": "FastAPI 快速开发指南",
-            "content": "FastAPI 是现代 Python Web 框架...",
-            "summary": "FastAPI 核心特性介绍",
-            "tags": ["FastAPI", "Web开发"],
-            "status": PostStatus.PUBLISHED,
-            "published_at_offset": -20,
-        },
-        {
-            "title": "Web 开发最佳实践",
-            "content": "现代 Web 开发需要考虑很多因素...",
-            "summary": "Web 开发经验总结",
-            "tags": ["Web开发", "实战"],
-            "status": PostStatus.PUBLISHED,
-            "published_at_offset": -15,
-        },
-        {
-            "title": "Python 数据分析实战",
-            "content": "使用 Python 进行数据分析...",
-            "summary": "数据分析项目实战",
-            "tags": ["Python", "实战"],
-            "status": PostStatus.PUBLISHED,
-            "published_at_offset": -10,
-        },
-        # 归档文章
-        {
-            "title": "FastAPI 性能优化技巧",
-            "content": "如何优化 FastAPI 应用性能...",
-            "summary": "性能优化经验分享",
-            "tags": ["FastAPI", "性能"],
-            "status": PostStatus.ARCHIVED,
-            "published_at_offset": -5,
-        },
-        # 草稿文章
-        {
-            "title": "Django vs FastAPI 对比",
-            "content": "Django 和 FastAPI 的详细对比...",
-            "summary": "框架对比分析",
-            "tags": ["Django", "FastAPI"],
-            "status": PostStatus.DRAFT,
-            "published_at_offset": -1,
-        },
-        {
-            "title": "Python 异步编程详解",
-            "content": "深入理解 Python 异步编程...",
-            "summary": "异步编程概念解析",
-            "tags": ["Python", "异步"],
-            "status": PostStatus.DRAFT,
-            "published_at_offset": None,
-        },
-    ]
+    注意：保持 function 作用域。corpus 行依赖 session fixture 的
+    SAVEPOINT 回滚做隔离，提升作用域会让数据泄漏到"空列表"类测试；
+    数据模板已提升为模块级常量 _SAMPLE_POST_TEMPLATES，避免重复构建。
+
+    性能：直接构建 ORM 对象 + 一次 add_all + 一次 commit，
+    替代逐篇 create_post（每篇一次 commit + refresh 往返）。
+    """
 
     posts = []
     base_time = datetime.now()
+    tags_by_name: dict[str, Tag] = {}
 
-    for _, template in enumerate(post_templates):
-        # 创建文章
-        post_in = PostCreate(
+    for template in _SAMPLE_POST_TEMPLATES:
+        post = Post(
             title=template["title"],
             content=template["content"],
             summary=template["summary"],
-            tags=template["tags"],
-        )
-
-        post = post_crud.create_post(
-            db=session, post_in=post_in, author_id=sample_user.id
+            slug=Post._generate_slug_from_title(template["title"]),
+            status=template["status"],
+            author_id=sample_user.id,
         )
-
-        # 手动设置发布状态和发布时间
-        post.status = template["status"]
         if template["published_at_offset"] is not None:
             post.published_at = base_time + timedelta(
                 days=template["published_at_offset"]
             )
 
-        session.add(post)
+        # 标签沿用 CRUD 层的 get_or_create（含名称标准化），每个标签只查一次
+        for tag_name in template["tags"]:
+            if tag_name not in tags_by_name:
+                tags_by_name[tag_name] = tag_crud.get_or_create_tag(
+                    session, name=tag_name
+                )
+            post.tags.append(tags_by_name[tag_name])
+
         posts.append(post)
 
+    session.add_all(posts)
     session.commit()
     return posts
 
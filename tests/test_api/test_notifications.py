@@ -458,9 +458,10 @@ class TestMarkAsRead:
 
         # 验证返回200
         assert response.status_code == 200
-        assert response.json()["is_read"] is True
-        assert response.json()["read_at"] is not None
-        assert response.json()["id"] == notification_id
+        data = response.json()
+        assert data["is_read"] is True
+        assert data["read_at"] is not None
+        assert data["id"] == notification_id
 
     def test_mark_nonexistent_notification_as_read(
         self,
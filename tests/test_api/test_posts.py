@@ -13,16 +13,18 @@
 - DELETE /posts/{post_id} - 删除文章（权限控制）
 """
 
-from pprint import pprint  # noqa: F401
+import uuid
+from collections.abc import Callable
 from uuid import UUID
 
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 import app.crud.post as post_crud
-from app.core.security import create_access_token
+from app.core.security import create_access_token, hash_password
 from app.models.post import Post, PostStatus
 from app.models.user import User
 from app.schemas.post import PostCreate
@@ -32,6 +34,29 @@ from app.schemas.post import PostCreate
 # ============================================
 
 
+def _make_post_in(title: str, content: str = "内容") -> PostCreate:
+    """构建测试用 PostCreate，跳过 Pydantic 校验
+
+    测试数据是可信常量，model_construct 省去每次完整校验的开销；
+    生产代码路径不受影响。
+    """
+    return PostCreate.model_construct(
+        title=title, content=content, summary=None, slug=None, tags=None
+    )
+
+
+# 状态流转测试使用的固定创建载荷：整个模块只构建一次
+# （create_post 只读 schema，不会修改它，可以安全共享）
+_DRAFT_IN = _make_post_in("草稿")
+_POST_IN = _make_post_in("文章")
+
+# 不存在的文章/作者 ID：全零 UUID，所有 404 / 空结果场景共用
+MISSING_POST_ID = str(uuid.UUID(int=0))
+
+# post_data 创建成功后期望的标签集合（名称经过标准化：首字母大写）
+EXPECTED_CREATE_TAGS = frozenset({"Python", "Fastapi", "测试"})
+
+
 @pytest.fixture
 def post_data() -> dict:
     """API 测试用的文章数据"""
@@ -43,13 +68,18 @@ def post_data() -> dict:
     }
 
 
+@pytest.fixture(scope="module")
+def update_data() -> dict:
+    """更新文章用的公共载荷（各测试只读，可安全共享一份）"""
+    return {
+        "title": "更新后的标题",
+        "summary": "更新后的摘要",
+    }
+
+
 @pytest.fixture
 def other_user(session: Session) -> User:
     """创建第二个用户用于权限测试（直接使用 ORM 而非 UserCreate schema）"""
-    import uuid
-
-    from app.core.security import hash_password
-
     user = User(
         username=f"other_user_{uuid.uuid4().hex[:8]}",
         email=f"other_{uuid.uuid4().hex[:8]}@example.com",
@@ -106,21 +136,13 @@ class TestCreatePost:
 
         # 4. 验证标签信息
         assert len(data["tags"]) == 3
-        tag_names = {tag["name"] for tag in data["tags"]}
-        # 注意：标签名称会被标准化（首字母大写）
-        assert tag_names == {"Python", "Fastapi", "测试"}
+        assert frozenset(tag["name"] for tag in data["tags"]) == EXPECTED_CREATE_TAGS
 
-        # 5. 验证数据库
-        db_post = session.query(Post).filter(Post.id == UUID(data["id"])).first()
+        # 5. 验证数据库（session.get 走主键/恒等映射快速路径）
+        db_post = session.get(Post, UUID(data["id"]))
         assert db_post is not None
         assert db_post.title == post_data["title"]
 
-    def test_create_post_without_auth(self, client: TestClient, post_data: dict):
-        """✅ 异常数据：测试未登录创建文章 - 应该返回 401"""
-        # 注意：没有 headers 参数
-        response = client.post("/api/v1/posts/", json=post_data)
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_create_post_with_custom_slug(
         self,
         client: TestClient,
@@ -155,7 +177,6 @@ class TestCreatePost:
 
         assert response.status_code == status.HTTP_409_CONFLICT
         error_data = response.json()["error"]
-        print(error_data)
         assert error_data["code"] == "DATABASE_INTEGRITY_ERROR"
         assert error_data["details"] is not None
         # 检查错误消息包含冲突相关信息
@@ -173,16 +194,15 @@ class TestCreatePost:
 
         assert response.status_code == status.HTTP_201_CREATED
 
-    def test_create_post_invalid_data(
-        self,
-        client: TestClient,
-        auth_headers: dict,
-    ):
-        """✅ 异常数据：测试创建文章时缺少必填字段（应该返回 422）"""
-        post_data = {"title": "缺少 content"}
-        response = client.post("/api/v1/posts/", json=post_data, headers=auth_headers)
+    def test_create_post_invalid_data(self):
+        """✅ 异常数据：测试创建文章时缺少必填字段（应该校验失败）
 
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        只验证 Pydantic 校验规则，直接构造 schema 即可命中同一段
+        校验代码，无需经过完整的 ASGI / 依赖注入栈（FastAPI 把
+        ValidationError 转成 422 的通路由 invalid_uuid 测试覆盖）。
+        """
+        with pytest.raises(ValidationError):
+            PostCreate(title="缺少 content")
 
 
 # ============================================
@@ -198,7 +218,6 @@ class TestGetPosts:
         response = client.get("/api/v1/posts/")
 
         assert response.status_code == status.HTTP_200_OK
-        print(response.json())
         data = response.json()
         assert isinstance(data["items"], list)
         assert len(data["items"]) == 0
@@ -240,7 +259,6 @@ class TestGetPosts:
         response = client.get("/api/v1/posts/?page=1&size=3")
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
-        pprint(data)
         assert data["page"] == 1
         assert data["size"] == 3
 
@@ -267,7 +285,6 @@ class TestGetPosts:
         response = client.get("/api/v1/posts/?title_contains=python")
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
-        print(data)
 
         # 验证所有返回的文章标题都包含"python"(忽略大小写)
         for post in data["items"]:
@@ -282,8 +299,9 @@ class TestGetPosts:
         data = response.json()
 
         # 验证所有返回的文章都是该作者的
+        expected_author = str(sample_user.id)
         for post in data["items"]:
-            assert post["author"]["id"] == str(sample_user.id)
+            assert post["author"]["id"] == expected_author
 
     def test_get_posts_filter_by_tag(
         self, client: TestClient, sample_posts: list[Post]
@@ -309,33 +327,25 @@ class TestGetPosts:
         data = response.json()
 
         # 验证所有文章都满足组合条件
+        expected_author = str(sample_user.id)
         for post in data["items"]:
-            assert post["author"]["id"] == str(sample_user.id)
+            assert post["author"]["id"] == expected_author
             tag_names = [tag["name"] for tag in post["tags"]]
             assert "Tag1" in tag_names
 
+    @pytest.mark.parametrize(
+        "query_string",
+        [
+            f"author_id={MISSING_POST_ID}",  # 不存在的作者ID
+            "tag_name=NonExistentTag",  # 不存在的标签
+            "title_contains=NonExistentTitle",  # 不存在的标题关键词
+        ],
+    )
     def test_get_posts_filter_edge_cases(
-        self, client: TestClient, sample_posts: list[Post]
+        self, client: TestClient, sample_posts: list[Post], query_string: str
     ):
-        """✅ 边界数据：测试过滤功能的边界情况"""
-        # 测试不存在的作者ID
-        response = client.get(
-            "/api/v1/posts/?author_id=00000000-0000-0000-0000-000000000000"
-        )
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["total"] == 0
-        assert len(data["items"]) == 0
-
-        # 测试不存在的标签
-        response = client.get("/api/v1/posts/?tag_name=NonExistentTag")
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["total"] == 0
-        assert len(data["items"]) == 0
-
-        # 测试不存在的标题关键词
-        response = client.get("/api/v1/posts/?title_contains=NonExistentTitle")
+        """✅ 边界数据：测试过滤功能的边界情况（命中不到任何文章）"""
+        response = client.get(f"/api/v1/posts/?{query_string}")
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert data["total"] == 0
@@ -357,8 +367,9 @@ class TestGetPosts:
         assert len(data["items"]) <= 3
 
         # 验证所有文章都是该作者的
+        expected_author = str(sample_user.id)
         for post in data["items"]:
-            assert post["author"]["id"] == str(sample_user.id)
+            assert post["author"]["id"] == expected_author
 
 
 # ============================================
@@ -381,19 +392,19 @@ class TestGetUserDrafts:
 
         draft1 = post_crud.create_post(
             db=session,
-            post_in=PostCreate(title="草稿1", content="内容1"),
+            post_in=_make_post_in("草稿1", "内容1"),
             author_id=sample_user.id,
         )
         draft2 = post_crud.create_post(
             db=session,
-            post_in=PostCreate(title="草稿2", content="内容2"),
+            post_in=_make_post_in("草稿2", "内容2"),
             author_id=sample_user.id,
         )
 
         # 发布一篇文章（不应该出现在草稿列表中）
         published_post = post_crud.create_post(
             db=session,
-            post_in=PostCreate(title="已发布", content="内容"),
+            post_in=_make_post_in("已发布"),
             author_id=sample_user.id,
         )
         post_crud.publish_post(
@@ -457,15 +468,6 @@ class TestGetPost:
         assert data["title"] == sample_post.title
         assert data["content"] == sample_post.content
 
-    def test_get_post_not_found(
-        self,
-        client: TestClient,
-    ):
-        """✅ 异常数据：测试获取不存在的文章（应该返回 404）"""
-        response = client.get("/api/v1/posts/00000000-0000-0000-0000-000000000000")
-
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-
     def test_get_post_invalid_uuid(
         self,
         client: TestClient,
@@ -489,13 +491,9 @@ class TestUpdatePost:
         client: TestClient,
         sample_post: Post,  # type: ignore
         auth_headers: dict,
+        update_data: dict,
     ):
         """✅ 正常数据：测试作者成功更新自己的文章"""
-        update_data = {
-            "title": "更新后的标题",
-            "summary": "更新后的摘要",
-        }
-
         response = client.patch(
             f"/api/v1/posts/{sample_post.id}",
             json=update_data,
@@ -509,60 +507,6 @@ class TestUpdatePost:
         # content 未更新，应该保持原值
         assert data["content"] == sample_post.content
 
-    def test_update_post_without_auth(
-        self,
-        client: TestClient,
-        sample_post: Post,  # type: ignore
-    ):
-        """✅ 异常数据：测试未登录用户更新文章（应该返回 401）"""
-        update_data = {
-            "title": "更新后的标题",
-            "summary": "更新后的摘要",
-        }
-
-        response = client.patch(
-            f"/api/v1/posts/{sample_post.id}",
-            json=update_data,
-        )
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_update_post_not_author(
-        self,
-        client: TestClient,
-        sample_post: Post,  # type: ignore
-        other_user_headers: dict,
-    ):
-        """✅ 异常数据：测试非作者更新文章（应该返回 403）"""
-        update_data = {
-            "title": "更新后的标题",
-            "summary": "更新后的摘要",
-        }
-        response = client.patch(
-            f"/api/v1/posts/{sample_post.id}",
-            json=update_data,
-            headers=other_user_headers,  #  另一个用户的 token
-        )
-
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_update_post_not_found(
-        self,
-        client: TestClient,
-        auth_headers: dict,
-    ):
-        """✅ 异常数据：测试更新不存在的文章（应该返回 404）"""
-        update_data = {
-            "title": "更新后的标题",
-            "summary": "更新后的摘要",
-        }
-        response = client.patch(
-            "/api/v1/posts/00000000-0000-0000-0000-000000000000",
-            json=update_data,
-            headers=auth_headers,
-        )
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-
     def test_update_post_tags(
         self,
         client: TestClient,
@@ -588,97 +532,56 @@ class TestUpdatePost:
 
 
 # ============================================
-# PATCH /posts/{post_id}/publish - 发布文章 (Phase 6.1)
+# 文章状态生命周期 (publish / archive / revert-to-draft)
 # ============================================
 
 
-class TestPublishPost:
-    """测试发布文章 API"""
+class TestPostLifecycle:
+    """测试文章状态机的成功流转路径
 
-    def test_publish_post_success(
-        self,
-        client: TestClient,
-        session: Session,
-        auth_headers: dict,
-        sample_user: User,
-    ):
-        """✅ 正常数据：测试成功发布草稿"""
-        # 创建草稿文章
-
-        draft_post = post_crud.create_post(
-            db=session,
-            post_in=PostCreate(title="草稿文章", content="内容"),
-            author_id=sample_user.id,
-        )
+    publish / archive / revert-to-draft 的成功场景是同一状态机上的
+    不同路径，用一篇文章按步骤序列走完整个流转，替代每个端点单独
+    建文章的重复测试。
+    """
 
-        response = client.patch(
-            f"/api/v1/posts/{draft_post.id}/publish", headers=auth_headers
-        )
-
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["status"] == "published"
-        assert data["published_at"] is not None
-
-    def test_publish_post_not_found(
-        self,
-        client: TestClient,
-        auth_headers: dict,
-    ):
-        """✅ 异常数据：测试发布不存在的文章（应该返回 404）"""
-        response = client.patch(
-            "/api/v1/posts/00000000-0000-0000-0000-000000000000/publish",
-            headers=auth_headers,
-        )
-
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-
-    def test_publish_post_already_published(
+    @pytest.mark.parametrize(
+        "steps,expected_status,published_at_set",
+        [
+            (["publish"], "published", True),
+            (["publish", "archive"], "archived", True),
+            (["publish", "revert-to-draft"], "draft", False),
+            (["publish", "archive", "revert-to-draft"], "draft", False),
+        ],
+    )
+    def test_lifecycle_transitions(
         self,
         client: TestClient,
         session: Session,
         auth_headers: dict,
         sample_user: User,
+        steps: list[str],
+        expected_status: str,
+        published_at_set: bool,
     ):
-        """✅ 异常数据：测试发布已发布的文章（应该返回 409）"""
-        # 创建并发布文章
-
+        """✅ 正常数据：测试按步骤序列流转文章状态"""
         post = post_crud.create_post(
             db=session,
-            post_in=PostCreate(title="文章", content="内容"),
-            author_id=sample_user.id,
-        )
-        post_crud.publish_post(db=session, post_id=post.id, user_id=post.author_id)
-
-        # 尝试再次发布
-        response = client.patch(
-            f"/api/v1/posts/{post.id}/publish", headers=auth_headers
-        )
-
-        assert response.status_code == status.HTTP_409_CONFLICT
-
-    def test_publish_post_not_author(
-        self,
-        client: TestClient,
-        session: Session,
-        other_user_headers: dict,
-        sample_user: User,
-    ):
-        """✅ 异常数据：测试非作者发布文章（应该返回 403）"""
-        # 创建草稿文章
-
-        draft_post = post_crud.create_post(
-            db=session,
-            post_in=PostCreate(title="草稿", content="内容"),
+            post_in=_DRAFT_IN,
             author_id=sample_user.id,
         )
 
-        # 其他用户尝试发布
-        response = client.patch(
-            f"/api/v1/posts/{draft_post.id}/publish", headers=other_user_headers
-        )
+        for step in steps:
+            response = client.patch(
+                f"/api/v1/posts/{post.id}/{step}", headers=auth_headers
+            )
+            assert response.status_code == status.HTTP_200_OK
 
-        assert response.status_code == status.HTTP_403_FORBIDDEN
+        data = response.json()
+        assert data["status"] == expected_status
+        if published_at_set:
+            assert data["published_at"] is not None
+        else:
+            assert data["published_at"] is None
 
     def test_publish_post_without_auth(
         self,
@@ -687,11 +590,9 @@ class TestPublishPost:
         sample_user: User,
     ):
         """✅ 异常数据：测试未登录发布文章（应该返回 401）"""
-        # 创建草稿文章
-
         draft_post = post_crud.create_post(
             db=session,
-            post_in=PostCreate(title="草稿", content="内容"),
+            post_in=_DRAFT_IN,
             author_id=sample_user.id,
         )
 
@@ -701,214 +602,181 @@ class TestPublishPost:
 
 
 # ============================================
-# PATCH /posts/{post_id}/archive - 归档文章 (Phase 6.1)
+# 状态转换公共异常场景 (publish / archive / revert-to-draft)
 # ============================================
 
 
-class TestArchivePost:
-    """测试归档文章 API"""
+class TestPostStatusTransitionErrors:
+    """参数化测试三个状态转换端点的公共异常场景
 
-    def test_archive_post_success(
-        self,
-        client: TestClient,
-        session: Session,
-        auth_headers: dict,
-        sample_user: User,
-    ):
-        """✅ 正常数据：测试成功归档已发布文章"""
-        # 创建并发布文章
+    publish / archive / revert-to-draft 的 404 / 403 / 409 场景
+    只有端点路径和文章初始状态不同，用参数化代替逐个复制测试方法。
+    """
 
-        post = post_crud.create_post(
-            db=session,
-            post_in=PostCreate(title="文章", content="内容"),
-            author_id=sample_user.id,
-        )
-        post_crud.publish_post(db=session, post_id=post.id, user_id=post.author_id)
+    @pytest.fixture
+    def make_post_in_state(
+        self, session: Session, sample_user: User
+    ) -> Callable[[PostStatus], Post]:
+        """工厂 fixture：创建处于指定状态的测试文章"""
 
-        response = client.patch(
-            f"/api/v1/posts/{post.id}/archive", headers=auth_headers
-        )
+        def _make(initial_status: PostStatus) -> Post:
+            post = post_crud.create_post(
+                db=session,
+                post_in=_POST_IN,
+                author_id=sample_user.id,
+            )
+            if initial_status in (PostStatus.PUBLISHED, PostStatus.ARCHIVED):
+                post_crud.publish_post(
+                    db=session, post_id=post.id, user_id=post.author_id
+                )
+            if initial_status == PostStatus.ARCHIVED:
+                post_crud.archive_post(
+                    db=session, post_id=post.id, user_id=post.author_id
+                )
+            return post
 
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["status"] == "archived"
+        return _make
 
-    def test_archive_post_not_found(
+    @pytest.mark.parametrize("action", ["publish", "archive", "revert-to-draft"])
+    def test_transition_not_found(
         self,
         client: TestClient,
         auth_headers: dict,
+        action: str,
     ):
-        """✅ 异常数据：测试归档不存在的文章（应该返回 404）"""
+        """✅ 异常数据：测试对不存在的文章执行状态转换（应该返回 404）"""
         response = client.patch(
-            "/api/v1/posts/00000000-0000-0000-0000-000000000000/archive",
+            f"/api/v1/posts/{MISSING_POST_ID}/{action}",
             headers=auth_headers,
         )
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    def test_archive_post_draft(
+    @pytest.mark.parametrize(
+        "action,initial_status",
+        [
+            ("publish", PostStatus.DRAFT),
+            ("archive", PostStatus.PUBLISHED),
+            ("revert-to-draft", PostStatus.PUBLISHED),
+        ],
+    )
+    def test_transition_not_author(
         self,
         client: TestClient,
-        session: Session,
-        auth_headers: dict,
-        sample_user: User,
+        other_user_headers: dict,
+        make_post_in_state: Callable[[PostStatus], Post],
+        action: str,
+        initial_status: PostStatus,
     ):
-        """✅ 异常数据：测试归档草稿文章（应该返回 409）"""
-        # 创建草稿文章
-
-        draft_post = post_crud.create_post(
-            db=session,
-            post_in=PostCreate(title="草稿", content="内容"),
-            author_id=sample_user.id,
-        )
+        """✅ 异常数据：测试非作者执行状态转换（应该返回 403）"""
+        post = make_post_in_state(initial_status)
 
         response = client.patch(
-            f"/api/v1/posts/{draft_post.id}/archive", headers=auth_headers
+            f"/api/v1/posts/{post.id}/{action}", headers=other_user_headers
         )
 
-        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    def test_archive_post_not_author(
+    @pytest.mark.parametrize(
+        "action,initial_status",
+        [
+            ("publish", PostStatus.PUBLISHED),  # 重复发布
+            ("archive", PostStatus.DRAFT),  # 归档草稿
+            ("revert-to-draft", PostStatus.DRAFT),  # 回退已是草稿的文章
+        ],
+    )
+    def test_invalid_transition_conflict(
         self,
         client: TestClient,
-        session: Session,
-        other_user_headers: dict,
-        sample_user: User,
+        auth_headers: dict,
+        make_post_in_state: Callable[[PostStatus], Post],
+        action: str,
+        initial_status: PostStatus,
     ):
-        """✅ 异常数据：测试非作者归档文章（应该返回 403）"""
-        # 创建并发布文章
+        """✅ 异常数据：测试非法的状态转换（应该返回 409）"""
+        post = make_post_in_state(initial_status)
 
-        post = post_crud.create_post(
-            db=session,
-            post_in=PostCreate(title="文章", content="内容"),
-            author_id=sample_user.id,
-        )
-        post_crud.publish_post(db=session, post_id=post.id, user_id=post.author_id)
-
-        # 其他用户尝试归档
         response = client.patch(
-            f"/api/v1/posts/{post.id}/archive", headers=other_user_headers
+            f"/api/v1/posts/{post.id}/{action}", headers=auth_headers
         )
 
-        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.status_code == status.HTTP_409_CONFLICT
 
 
 # ============================================
-# PATCH /posts/{post_id}/revert-to-draft - 回退为草稿 (Phase 6.1)
+# CRUD 端点公共异常场景 (401 / 403 / 404)
 # ============================================
 
 
-class TestRevertToDraft:
-    """测试回退为草稿 API"""
+class TestPostCommonErrors:
+    """参数化测试文章 CRUD 端点的公共异常场景
 
-    def test_revert_published_to_draft_success(
-        self,
-        client: TestClient,
-        session: Session,
-        auth_headers: dict,
-        sample_user: User,
-    ):
-        """✅ 正常数据：测试成功将已发布文章回退为草稿"""
-        # 创建并发布文章
+    创建/读取/更新/删除的 401 / 403 / 404 场景只有 HTTP 动词和
+    路径不同，与状态转换异常测试同样用参数化合并，减少重复的
+    fixture 构建。
+    """
 
-        post = post_crud.create_post(
-            db=session,
-            post_in=PostCreate(title="文章", content="内容"),
-            author_id=sample_user.id,
-        )
-        post_crud.publish_post(db=session, post_id=post.id, user_id=post.author_id)
-
-        response = client.patch(
-            f"/api/v1/posts/{post.id}/revert-to-draft", headers=auth_headers
-        )
-
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["status"] == "draft"
-        assert data["published_at"] is None
-
-    def test_revert_archived_to_draft_success(
+    @pytest.mark.parametrize(
+        "method,path_tmpl",
+        [
+            ("post", "/api/v1/posts/"),
+            ("patch", "/api/v1/posts/{id}"),
+            ("delete", "/api/v1/posts/{id}"),
+        ],
+    )
+    def test_requires_auth(
         self,
         client: TestClient,
-        session: Session,
-        auth_headers: dict,
-        sample_user: User,
+        sample_post: Post,
+        post_data: dict,
+        method: str,
+        path_tmpl: str,
     ):
-        """✅ 正常数据：测试成功将已归档文章回退为草稿"""
-        # 创建、发布并归档文章
+        """✅ 异常数据：测试未登录访问需要认证的端点（应该返回 401）"""
+        url = path_tmpl.format(id=sample_post.id)
+        json_body = post_data if method in ("post", "patch") else None
 
-        post = post_crud.create_post(
-            db=session,
-            post_in=PostCreate(title="文章", content="内容"),
-            author_id=sample_user.id,
-        )
-        post_crud.publish_post(db=session, post_id=post.id, user_id=post.author_id)
-        post_crud.archive_post(db=session, post_id=post.id, user_id=post.author_id)
+        response = client.request(method, url, json=json_body)
 
-        response = client.patch(
-            f"/api/v1/posts/{post.id}/revert-to-draft", headers=auth_headers
-        )
-
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["status"] == "draft"
-        assert data["published_at"] is None
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_revert_post_not_found(
+    @pytest.mark.parametrize("method", ["get", "patch", "delete"])
+    def test_not_found(
         self,
         client: TestClient,
         auth_headers: dict,
+        update_data: dict,
+        method: str,
     ):
-        """✅ 异常数据：测试回退不存在的文章（应该返回 404）"""
-        response = client.patch(
-            "/api/v1/posts/00000000-0000-0000-0000-000000000000/revert-to-draft",
+        """✅ 异常数据：测试操作不存在的文章（应该返回 404）"""
+        json_body = update_data if method == "patch" else None
+
+        response = client.request(
+            method,
+            f"/api/v1/posts/{MISSING_POST_ID}",
             headers=auth_headers,
+            json=json_body,
         )
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    def test_revert_already_draft(
+    @pytest.mark.parametrize("method", ["patch", "delete"])
+    def test_not_author(
         self,
         client: TestClient,
-        session: Session,
-        auth_headers: dict,
-        sample_user: User,
-    ):
-        """✅ 异常数据：测试回退已是草稿的文章（应该返回 409）"""
-        # 创建草稿文章
-
-        draft_post = post_crud.create_post(
-            db=session,
-            post_in=PostCreate(title="草稿", content="内容"),
-            author_id=sample_user.id,
-        )
-
-        response = client.patch(
-            f"/api/v1/posts/{draft_post.id}/revert-to-draft", headers=auth_headers
-        )
-
-        assert response.status_code == status.HTTP_409_CONFLICT
-
-    def test_revert_post_not_author(
-        self,
-        client: TestClient,
-        session: Session,
+        sample_post: Post,
         other_user_headers: dict,
-        sample_user: User,
+        update_data: dict,
+        method: str,
     ):
-        """✅ 异常数据：测试非作者回退文章（应该返回 403）"""
-        # 创建并发布文章
-
-        post = post_crud.create_post(
-            db=session,
-            post_in=PostCreate(title="文章", content="内容"),
-            author_id=sample_user.id,
-        )
-        post_crud.publish_post(db=session, post_id=post.id, user_id=post.author_id)
+        """✅ 异常数据：测试非作者修改他人文章（应该返回 403）"""
+        json_body = update_data if method == "patch" else None
 
-        # 其他用户尝试回退
-        response = client.patch(
-            f"/api/v1/posts/{post.id}/revert-to-draft", headers=other_user_headers
+        response = client.request(
+            method,
+            f"/api/v1/posts/{sample_post.id}",
+            headers=other_user_headers,
+            json=json_body,
         )
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -925,6 +793,7 @@ class TestDeletePost:
     def test_delete_post_success(
         self,
         client: TestClient,
+        session: Session,
         sample_post: Post,
         auth_headers: dict,
     ):
@@ -939,49 +808,5 @@ class TestDeletePost:
         # 2. 验证响应体为空
         assert response.text == ""
 
-        # 3. 验证文章已被删除（再次获取应该 404）
-        get_response = client.get(f"/api/v1/posts/{post_id}")
-        assert get_response.status_code == status.HTTP_404_NOT_FOUND
-
-    def test_delete_post_without_auth(
-        self,
-        client: TestClient,
-        sample_post: Post,
-    ):
-        """✅ 异常数据：测试未登录用户删除文章（应该返回 401）"""
-        post_id = sample_post.id
-
-        response = client.delete(f"/api/v1/posts/{post_id}")
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_delete_post_not_author(
-        self,
-        client: TestClient,
-        sample_post: Post,
-        other_user_headers: dict,
-    ):
-        """✅ 异常数据：测试非作者删除文章（应该返回 403）"""
-        post_id = sample_post.id
-
-        response = client.delete(
-            f"/api/v1/posts/{post_id}",
-            headers=other_user_headers,
-        )
-
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_delete_post_not_found(
-        self,
-        client: TestClient,
-        auth_headers: dict,
-    ):
-        """✅ 异常数据：测试删除不存在的文章（应该返回 404）"""
-        post_id = "00000000-0000-0000-0000-000000000000"
-
-        response = client.delete(
-            f"/api/v1/posts/{post_id}",
-            headers=auth_headers,
-        )
-
-        assert response.status_code == status.HTTP_404_NOT_FOUND
+        # 3. 验证文章已被删除（直接查数据库，404 路径已有专门测试覆盖）
+        assert session.get(Post, post_id) is None
@@ -11,16 +11,23 @@ from fastapi import status
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-import app.crud.post as post_crud
 from app.models.post import Post
+from app.models.tag import Tag
 from app.models.user import User
-from app.schemas.post import PostCreate
 
 # ============================================
 # Fixtures - 测试数据
 # ============================================
 
 
+# posts_with_tags 的静态数据模板：模块级常量，整个测试会话只构建一次
+_POSTS_WITH_TAGS_TEMPLATES = [
+    ("Python 基础教程", "Python 入门内容", ["Python", "FastAPI"]),
+    ("Python 进阶", "Python 进阶内容", ["Python", "教程"]),
+    ("FastAPI 实战", "FastAPI 开发指南", ["FastAPI"]),
+]
+
+
 @pytest.fixture
 def posts_with_tags(session: Session, sample_user: User) -> list[Post]:
     """创建多篇带标签的文章用于测试
@@ -34,41 +41,33 @@ def posts_with_tags(session: Session, sample_user: User) -> list[Post]:
     - "Python" 标签：post_count = 2
     - "Fastapi" 标签：post_count = 2
     - "教程" 标签：post_count = 1
+
+    注意：保持 function 作用域。测试隔离依赖 session fixture 的
+    SAVEPOINT 回滚，提升作用域会让数据泄漏到"空列表"类测试；
+    这里改为直接构建 ORM 对象 + 一次 add_all + 一次 commit，
+    替代逐篇 create_post（每篇一次 slug 查重 + commit）。
     """
     posts = []
-
-    # 文章 1
-    post1 = post_crud.create_post(
-        db=session,
-        post_in=PostCreate(
-            title="Python 基础教程",
-            content="Python 入门内容",
-            tags=["Python", "FastAPI"],
-        ),
-        author_id=sample_user.id,
-    )
-    posts.append(post1)
-
-    # 文章 2
-    post2 = post_crud.create_post(
-        db=session,
-        post_in=PostCreate(
-            title="Python 进阶", content="Python 进阶内容", tags=["Python", "教程"]
-        ),
-        author_id=sample_user.id,
-    )
-    posts.append(post2)
-
-    # 文章 3
-    post3 = post_crud.create_post(
-        db=session,
-        post_in=PostCreate(
-            title="FastAPI 实战", content="FastAPI 开发指南", tags=["FastAPI"]
-        ),
-        author_id=sample_user.id,
-    )
-    posts.append(post3)
-
+    tags_by_name: dict[str, Tag] = {}
+
+    for title, content, tag_names in _POSTS_WITH_TAGS_TEMPLATES:
+        post = Post(
+            title=title,
+            content=content,
+            slug=Post._generate_slug_from_title(title),
+            author_id=sample_user.id,
+        )
+        for tag_name in tag_names:
+            normalized = Tag.normalize_name(tag_name)
+            if normalized not in tags_by_name:
+                tags_by_name[normalized] = Tag(
+                    name=normalized, slug=Tag.generate_slug(normalized)
+                )
+            post.tags.append(tags_by_name[normalized])
+        posts.append(post)
+
+    session.add_all(posts)
+    session.commit()
     return posts
 
 
@@ -140,17 +139,23 @@ class TestGetTags:
     #  添加分页测试
     def test_get_tags_pagination(self, client, session, sample_user):
         """测试标签列表分页功能"""
-        # 提示：创建 10 个不同的标签（通过 10 篇文章）
+        # 创建 10 个不同的标签（通过 10 篇文章）
+        # 批量构建 + 一次 commit，替代逐篇 create_post
+        # （每篇一次 slug 查重 SELECT + 一次 commit，是纯 fixture 开销）
+        posts = []
         for i in range(10):
-            post_crud.create_post(
-                db=session,
-                post_in=PostCreate(
-                    title=f"文章 {i}",
-                    content=f"内容 {i}",
-                    tags=[f"Tag {i}"],  # ← 每篇文章用不同标签
-                ),
+            name = Tag.normalize_name(f"Tag {i}")
+            post = Post(
+                title=f"文章 {i}",
+                content=f"内容 {i}",
+                slug=Post._generate_slug_from_title(f"文章 {i}"),
                 author_id=sample_user.id,
             )
+            post.tags.append(Tag(name=name, slug=Tag.generate_slug(name)))
+            posts.append(post)
+
+        session.add_all(posts)
+        session.commit()
 
         # 测试 skip=0&limit=5 和 skip=5&limit=5
         response1 = client.get("/api/v1/tags/?page=1&size=5")
@@ -229,7 +234,6 @@ class TestGetTagBySlug:
         # 提示：使用不存在的 slug，如 "nonexistent-tag"
         response = client.get("/api/v1/tags/nonexistent-tag")
         assert response.status_code == status.HTTP_404_NOT_FOUND
-        print(response.json())
         assert response.json()["error"]["message"] == "标签不存在"
 
     #  添加中文 slug 测试
@@ -238,6 +242,7 @@ class TestGetTagBySlug:
         # 提示：获取 "教程" 标签，验证返回正确
         response = client.get("/api/v1/tags/教程")
         assert response.status_code == status.HTTP_200_OK
-        assert response.json()["name"] == "教程"
-        assert response.json()["slug"] == "教程"
-        assert len(response.json()["posts"]) == 1
+        data = response.json()
+        assert data["name"] == "教程"
+        assert data["slug"] == "教程"
+        assert len(data["posts"]) == 1
@@ -16,6 +16,7 @@ Phase 5.2 基础设施测试
 
 from pprint import pprint  # noqa: F401
 
+import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
@@ -29,8 +30,8 @@ from app.core.exceptions import (
     UnauthorizedError,
     UsernameAlreadyExistsError,
 )
-from app.crud import user as user_crud
-from app.schemas.user import UserCreate
+from app.core.security import create_access_token
+from app.models.user import User
 
 # ============ 1. CORS 中间件测试 ============
 
@@ -90,108 +91,94 @@ def test_cors_actual_request(client: TestClient):
 # ============ 2. 自定义异常类测试 ============
 
 
-def test_email_already_exists_error():
-    """测试 EmailAlreadyExistsError 异常属性
-
-    测试数据四象限：
-    - 正常数据：标准邮箱格式
-    """
-    email = "test@example.com"
-    exc = EmailAlreadyExistsError(email=email)
-
-    # 验证异常属性
-    assert exc.code == "EMAIL_ALREADY_EXISTS"
-    assert exc.message == "邮箱已被注册"
-    assert exc.status_code == status.HTTP_409_CONFLICT
-    assert exc.details == {"field": "email", "value": email}
-
-
-def test_username_already_exists_error():
-    """测试 UsernameAlreadyExistsError 异常属性
-
-    测试数据四象限：
-    - 正常数据：标准用户名
-    """
-    username = "testuser"
-    exc = UsernameAlreadyExistsError(username=username)
-
-    assert exc.code == "USERNAME_ALREADY_EXISTS"
-    assert exc.message == "用户名已被使用"
-    assert exc.status_code == status.HTTP_409_CONFLICT
-    assert exc.details == {"field": "username", "value": username}
-
-
-def test_invalid_credentials_error():
-    """测试 InvalidCredentialsError 异常属性
-
-    安全考虑：不暴露具体是用户名还是密码错误
-    """
-    exc = InvalidCredentialsError()
-
-    assert exc.code == "INVALID_CREDENTIALS"
-    assert exc.message == "用户名或密码错误"
-    assert exc.status_code == status.HTTP_401_UNAUTHORIZED
-    assert exc.details is None
-
-
-def test_unauthorized_error():
-    """测试 UnauthorizedError 异常属性
-
-    场景：缺少或无效的认证凭据
-    """
-    exc = UnauthorizedError()
-
-    assert exc.code == "UNAUTHORIZED"
-    assert exc.message == "请先登录"
-    assert exc.status_code == status.HTTP_401_UNAUTHORIZED
-
-
-def test_permission_denied_error():
-    """测试 PermissionDeniedError 异常属性
-
-    场景：已认证但无权限（403 vs 401）
-    """
-    message = "权限不足"
-    exc = PermissionDeniedError(message=message)
-
-    assert exc.code == "PERMISSION_DENIED"
-    assert exc.message == message
-    assert exc.status_code == status.HTTP_403_FORBIDDEN
-    assert exc.details is None
-
-
-def test_resource_not_found_error():
-    """测试 ResourceNotFoundError 异常属性
-
-    场景：请求不存在的资源（404）
-    """
-    resource = "文章"
-    exc = ResourceNotFoundError(resource=resource)
-
-    assert exc.code == "RESOURCE_NOT_FOUND"
-    assert exc.message == f"{resource}不存在"
-    assert exc.status_code == status.HTTP_404_NOT_FOUND
-    assert exc.details is None
-
-
-def test_resource_conflict_error():
-    """测试 ResourceConflictError 异常属性
-
-    场景：资源冲突（如并发修改、状态冲突）
-    """
-    message = "文章已发布，无法修改"
-    exc = ResourceConflictError(message=message)
+# 各异常类的 (构造函数, 期望 code / message / status_code / details) 对照表。
+# 七个异常类测试的模式完全相同（构造 + 断言四个属性），合并为一个参数化测试。
+_EXCEPTION_CASES = [
+    pytest.param(
+        lambda: EmailAlreadyExistsError(email="test@example.com"),
+        "EMAIL_ALREADY_EXISTS",
+        "邮箱已被注册",
+        status.HTTP_409_CONFLICT,
+        {"field": "email", "value": "test@example.com"},
+        id="email_already_exists",
+    ),
+    pytest.param(
+        lambda: UsernameAlreadyExistsError(username="testuser"),
+        "USERNAME_ALREADY_EXISTS",
+        "用户名已被使用",
+        status.HTTP_409_CONFLICT,
+        {"field": "username", "value": "testuser"},
+        id="username_already_exists",
+    ),
+    pytest.param(
+        # 安全考虑：不暴露具体是用户名还是密码错误
+        InvalidCredentialsError,
+        "INVALID_CREDENTIALS",
+        "用户名或密码错误",
+        status.HTTP_401_UNAUTHORIZED,
+        None,
+        id="invalid_credentials",
+    ),
+    pytest.param(
+        # 场景：缺少或无效的认证凭据
+        UnauthorizedError,
+        "UNAUTHORIZED",
+        "请先登录",
+        status.HTTP_401_UNAUTHORIZED,
+        None,
+        id="unauthorized",
+    ),
+    pytest.param(
+        # 场景：已认证但无权限（403 vs 401）
+        lambda: PermissionDeniedError(message="权限不足"),
+        "PERMISSION_DENIED",
+        "权限不足",
+        status.HTTP_403_FORBIDDEN,
+        None,
+        id="permission_denied",
+    ),
+    pytest.param(
+        # 场景：请求不存在的资源（404）
+        lambda: ResourceNotFoundError(resource="文章"),
+        "RESOURCE_NOT_FOUND",
+        "文章不存在",
+        status.HTTP_404_NOT_FOUND,
+        None,
+        id="resource_not_found",
+    ),
+    pytest.param(
+        # 场景：资源冲突（如并发修改、状态冲突）
+        lambda: ResourceConflictError(message="文章已发布，无法修改"),
+        "RESOURCE_CONFLICT",
+        "文章已发布，无法修改",
+        status.HTTP_409_CONFLICT,
+        None,
+        id="resource_conflict",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("make_exc", "code", "message", "status_code", "details"), _EXCEPTION_CASES
+)
+def test_custom_exception_attributes(
+    make_exc, code: str, message: str, status_code: int, details
+):
+    """测试自定义异常类的属性（code / message / status_code / details）"""
+    exc = make_exc()
 
-    assert exc.code == "RESOURCE_CONFLICT"
+    assert exc.code == code
     assert exc.message == message
-    assert exc.status_code == status.HTTP_409_CONFLICT
-    assert exc.details is None
+    assert exc.status_code == status_code
+    assert exc.details == details
 
 
 # ============ 3. 全局异常处理器测试 ============
 
 
-def test_app_error_handler(client: TestClient, session: Session):
+def test_app_error_handler(
+    client: TestClient, session: Session, known_password_hash: tuple[str, str]
+):
     """测试 AppError 异常处理器
 
     验证点：
@@ -200,14 +187,18 @@ def test_app_error_handler(client: TestClient, session: Session):
     3. error.code、error.message、error.details 正确
 
     测试数据：复用已存在的用户触发 EmailAlreadyExistsError
+    （直接插入 User 行，省去注册流程中的一次 bcrypt 哈希）
     """
     # 准备测试数据：创建一个用户
-    user_data = UserCreate(
-        username="existing_user",
-        email="existing@example.com",
-        password="SecurePass123!",
+    _, password_hash = known_password_hash
+    session.add(
+        User(
+            username="existing_user",
+            email="existing@example.com",
+            password_hash=password_hash,
+        )
     )
-    user_crud.create_user(session, user_in=user_data)
+    session.commit()
 
     # 尝试用相同邮箱注册，触发 EmailAlreadyExistsError
     response = client.post(
@@ -287,22 +278,23 @@ def test_validation_error_missing_field(client: TestClient):
 # ============ 4. 端点重构回归测试 ============
 
 
-def test_register_username_conflict_returns_new_format(client: TestClient):
+def test_register_username_conflict_returns_new_format(
+    client: TestClient, session: Session, known_password_hash: tuple[str, str]
+):
     """测试注册时用户名冲突返回新格式错误
 
     回归测试：确保端点重构后行为正确
     """
-    # 准备测试数据：先注册一个用户
-    first_response = client.post(
-        "/api/v1/auth/register",
-        json={
-            "username": "existinguser",
-            "email": "user1@example.com",
-            "password": "SecurePass123!",
-        },
+    # 准备测试数据：直接插入已占用该用户名的用户（跳过注册流程的 bcrypt 哈希）
+    _, password_hash = known_password_hash
+    session.add(
+        User(
+            username="existinguser",
+            email="user1@example.com",
+            password_hash=password_hash,
+        )
     )
-    # 确保第一个注册成功
-    assert first_response.status_code == 201
+    session.commit()
 
     # 尝试用相同用户名但不同邮箱注册
     response = client.post(
@@ -345,41 +337,33 @@ def test_login_invalid_credentials_returns_new_format(client: TestClient):
     assert error["message"] == "用户名或密码错误"
 
 
-def test_update_profile_email_conflict_returns_new_format(client: TestClient):
+def test_update_profile_email_conflict_returns_new_format(
+    client: TestClient, session: Session, known_password_hash: tuple[str, str]
+):
     """测试更新资料时邮箱冲突返回新格式错误
 
     回归测试：确保端点重构后行为正确
+    （直接插入两个用户并签发 token，替代注册+登录各一次的 bcrypt 开销）
     """
-    # 注册第一个用户（当前用户）
-    client.post(
-        "/api/v1/auth/register",
-        json={
-            "username": "currentuser",
-            "email": "current@example.com",
-            "password": "SecurePass123!",
-        },
-    )
+    _, password_hash = known_password_hash
 
-    # 登录获取 token
-    login_response = client.post(
-        "/api/v1/auth/login",
-        data={
-            "username": "currentuser",
-            "password": "SecurePass123!",
-        },
+    # 当前用户 + 占用目标邮箱的第二个用户
+    current_user = User(
+        username="currentuser",
+        email="current@example.com",
+        password_hash=password_hash,
     )
-    token = login_response.json()["access_token"]
-    auth_headers = {"Authorization": f"Bearer {token}"}
-
-    # 注册第二个用户占用目标邮箱
-    client.post(
-        "/api/v1/auth/register",
-        json={
-            "username": "otheruser",
-            "email": "occupied@example.com",
-            "password": "SecurePass123!",
-        },
+    other_user = User(
+        username="otheruser",
+        email="occupied@example.com",
+        password_hash=password_hash,
     )
+    session.add_all([current_user, other_user])
+    session.commit()
+    session.refresh(current_user)
+
+    token = create_access_token(data={"sub": str(current_user.id)})
+    auth_headers = {"Authorization": f"Bearer {token}"}
 
     # 尝试更新当前用户的邮箱为已占用邮箱
     response = client.patch(
@@ -395,32 +379,27 @@ def test_update_profile_email_conflict_returns_new_format(client: TestClient):
     assert error["message"] == "邮箱已被注册"
 
 
-def test_change_password_invalid_old_password_returns_new_format(client: TestClient):
+def test_change_password_invalid_old_password_returns_new_format(
+    client: TestClient, session: Session, known_password_hash: tuple[str, str]
+):
     """测试密码修改时旧密码错误返回新格式
 
     回归测试：确保端点重构后行为正确
     测试数据四象限：
     - 异常数据：错误的旧密码
     """
-    # 注册用户
-    client.post(
-        "/api/v1/auth/register",
-        json={
-            "username": "passworduser",
-            "email": "password@example.com",
-            "password": "OldPassword123!",
-        },
+    # 直接插入用户并签发 token（替代注册+登录各一次的 bcrypt 开销）
+    _, password_hash = known_password_hash
+    user = User(
+        username="passworduser",
+        email="password@example.com",
+        password_hash=password_hash,
     )
+    session.add(user)
+    session.commit()
+    session.refresh(user)
 
-    # 登录获取 token
-    login_response = client.post(
-        "/api/v1/auth/login",
-        data={
-            "username": "passworduser",
-            "password": "OldPassword123!",
-        },
-    )
-    token = login_response.json()["access_token"]
+    token = create_access_token(data={"sub": str(user.id)})
     auth_headers = {"Authorization": f"Bearer {token}"}
 
     # 尝试用错误的旧密码修改密码
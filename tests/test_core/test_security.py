@@ -18,9 +18,10 @@ Test Security Module - 安全模块测试
 """
 
 import re
-import time
 from datetime import timedelta
 
+import pytest
+
 from app.core.security import (
     create_access_token,
     decode_access_token,
@@ -33,6 +34,16 @@ from app.core.security import (
 BCRYPT_PATTERN = re.compile(r"^\$2b\$\d{2}\$[A-Za-z0-9./]{53}$")
 
 
+@pytest.fixture(scope="module")
+def sample_valid_token() -> str:
+    """模块级缓存的有效 token（payload 为 {"sub": "user123"}）
+
+    供只需要"一个结构完整的 token"的测试复用，
+    省去每个测试各自签名一次的开销。
+    """
+    return create_access_token({"sub": "user123"})
+
+
 def test_hash_password_returns_valid_hash() -> None:
     """测试：hash_password() 应该返回有效的 bcrypt 哈希值"""
     password = "TestPassword123"
@@ -45,20 +56,21 @@ def test_hash_password_returns_valid_hash() -> None:
     assert BCRYPT_PATTERN.match(hashed), f"哈希格式不正确: {hashed}"
 
 
-def test_verify_password_correct() -> None:
-    """测试：verify_password() 应该能验证正确的密码"""
-    password = "MySecret123"
-    hashed = hash_password(password)
+def test_verify_password_correct(known_password_hash: tuple[str, str]) -> None:
+    """测试：verify_password() 应该能验证正确的密码
+
+    复用会话级 (密码, 哈希) fixture，省去一次 bcrypt 哈希。
+    """
+    password, hashed = known_password_hash
 
     # 使用相同的密码应该验证成功
     assert verify_password(password, hashed) is True
 
 
-def test_verify_password_incorrect() -> None:
+def test_verify_password_incorrect(known_password_hash: tuple[str, str]) -> None:
     """测试：verify_password() 应该拒绝错误的密码"""
-    password = "MySecret123"
+    _, hashed = known_password_hash
     wrong_password = "WrongPassword"
-    hashed = hash_password(password)
 
     # 使用错误的密码应该验证失败
     assert verify_password(wrong_password, hashed) is False
@@ -108,19 +120,13 @@ def test_hash_password_special_characters() -> None:
 # ==========================================
 
 
-def test_create_access_token() -> None:
+def test_create_access_token(sample_valid_token: str) -> None:
     """测试：create_access_token() 应该生成有效的 JWT token"""
-    # 准备测试数据（通常包含用户 ID）
-    data = {"sub": "user123"}
-
-    # 生成 token
-    token = create_access_token(data)
-
     # 验证 token 是字符串
-    assert isinstance(token, str)
+    assert isinstance(sample_valid_token, str)
 
     # JWT 格式：header.payload.signature（三部分用 . 分隔）
-    parts = token.split(".")
+    parts = sample_valid_token.split(".")
     assert len(parts) == 3, "JWT token 应该有 3 部分（header.payload.signature）"
 
 
@@ -156,43 +162,41 @@ def test_decode_access_token_valid() -> None:
 
 def test_decode_access_token_expired() -> None:
     """测试：decode_access_token() 应该拒绝过期的 token"""
-    # 1. 创建一个立即过期的 token（过期时间设置为 1 秒）
+    # 1. 创建一个已经过期的 token（过期时间设置为 1 秒前，
+    #    无需真实等待，省去测试里的固定 sleep）
     data = {"sub": "user123"}
-    token = create_access_token(data, expires_delta=timedelta(seconds=1))
-
-    # 2. 等待 token 过期
-    time.sleep(2)  # 等待 2 秒确保过期
+    token = create_access_token(data, expires_delta=timedelta(seconds=-1))
 
-    # 3. 尝试解码过期的 token
+    # 2. 尝试解码过期的 token
     payload = decode_access_token(token)
 
-    # 4. 应该返回 None（token 已过期）
+    # 3. 应该返回 None（token 已过期）
     assert payload is None
 
 
-def test_decode_access_token_invalid_format() -> None:
-    """测试：decode_access_token() 应该拒绝格式错误的 token"""
-    # 测试各种无效的 token 格式
-    invalid_tokens = [
+@pytest.mark.parametrize(
+    "invalid_token",
+    [
         "not.a.jwt",  # 格式正确但内容无效
         "invalid_token",  # 完全无效的字符串
         "a.b",  # 只有两部分
         "",  # 空字符串
-    ]
+    ],
+)
+def test_decode_access_token_invalid_format(invalid_token: str) -> None:
+    """测试：decode_access_token() 应该拒绝格式错误的 token
 
-    for invalid_token in invalid_tokens:
-        payload = decode_access_token(invalid_token)
-        assert payload is None, f"应该拒绝无效 token: {invalid_token}"
+    参数化后每种无效格式独立报告，失败时直接定位具体输入。
+    """
+    payload = decode_access_token(invalid_token)
+    assert payload is None, f"应该拒绝无效 token: {invalid_token}"
 
 
-def test_decode_access_token_tampered() -> None:
+def test_decode_access_token_tampered(sample_valid_token: str) -> None:
     """测试：decode_access_token() 应该拒绝被篡改的 token"""
-    # 1. 创建一个有效的 token
-    data = {"sub": "user123"}
-    token = create_access_token(data)
-
+    # 1. 复用缓存的有效 token（只需要一个结构完整的签名可供篡改）
     # 2. 篡改 token（修改 payload 部分）
-    parts = token.split(".")
+    parts = sample_valid_token.split(".")
     # 修改中间部分（payload）的最后一个字符
     tampered_payload = parts[1][:-1] + ("a" if parts[1][-1] != "a" else "b")
     tampered_token = f"{parts[0]}.{tampered_payload}.{parts[2]}"
@@ -48,12 +48,9 @@ def test_cleanup_old_notifications(session: Session, sample_user, sample_admin)
 
 
 def test_follow_notifications_aggregate(
-    session: Session, sample_user: User, sample_user_data: Callable[[], dict[str, str]]
+    session: Session, sample_user: User, make_users: Callable[[int], list[User]]
 ) -> None:
-    follower_one = User(**sample_user_data())
-    follower_two = User(**sample_user_data())
-    session.add_all([follower_one, follower_two])
-    session.commit()
+    follower_one, follower_two = make_users(2)
 
     notification = notification_crud.create_or_update_notification(
         db=session,
@@ -80,13 +77,9 @@ def test_follow_notifications_aggregate(
 
 
 def test_follow_notifications_outside_window_creates_new_record(
-    session: Session, sample_user: User, sample_user_data: Callable[[], dict[str, str]]
+    session: Session, sample_user: User, make_users: Callable[[int], list[User]]
 ) -> None:
-    follower_one = User(**sample_user_data())
-    follower_two = User(**sample_user_data())
-    follower_three = User(**sample_user_data())
-    session.add_all([follower_one, follower_two, follower_three])
-    session.commit()
+    follower_one, follower_two, follower_three = make_users(3)
 
     notification = notification_crud.create_or_update_notification(
         db=session,
@@ -127,14 +120,10 @@ def test_follow_notifications_outside_window_creates_new_record(
 def test_like_notifications_outside_window_creates_new_record(
     session: Session,
     sample_user: User,
-    sample_user_data: Callable[[], dict[str, str]],
+    make_users: Callable[[int], list[User]],
     sample_post: Post,
 ) -> None:
-    liker_one = User(**sample_user_data())
-    liker_two = User(**sample_user_data())
-    liker_three = User(**sample_user_data())
-    session.add_all([liker_one, liker_two, liker_three])
-    session.commit()
+    liker_one, liker_two, liker_three = make_users(3)
 
     notification = notification_crud.create_or_update_notification(
         db=session,
@@ -178,13 +167,10 @@ def test_like_notifications_outside_window_creates_new_record(
 def test_like_notifications_aggregate(
     session: Session,
     sample_user: User,
-    sample_user_data: Callable[[], dict[str, str]],
+    make_users: Callable[[int], list[User]],
     sample_post: Post,
 ) -> None:
-    liker_one = User(**sample_user_data())
-    liker_two = User(**sample_user_data())
-    session.add_all([liker_one, liker_two])
-    session.commit()
+    liker_one, liker_two = make_users(2)
 
     notification = notification_crud.create_or_update_notification(
         db=session,
@@ -205,19 +191,19 @@ def test_like_notifications_aggregate(
         post_id=sample_post.id,
     )
     session.commit()
+    # refresh 已把最新列值重新加载到 notification 本体，
+    # 再 session.get 同一主键只是多一次查询，直接断言原实例即可
     session.refresh(notification)
 
-    refreshed_notification = session.get(Notification, notification.id)
-    assert refreshed_notification is not None
     assert aggregated_notification.id == notification.id
-    assert refreshed_notification.aggregated_count == 2
-    assert refreshed_notification.last_updated_at >= first_updated_at
+    assert notification.aggregated_count == 2
+    assert notification.last_updated_at >= first_updated_at
 
 
 def test_comment_notifications_aggregate(
     session: Session,
     sample_user: User,
-    sample_user_data: Callable[[], dict[str, str]],
+    make_users: Callable[[int], list[User]],
     sample_post: Post,
 ) -> None:
     parent_comment = Comment(
@@ -229,10 +215,8 @@ def test_comment_notifications_aggregate(
     )
     session.add(parent_comment)
 
-    replier_one = User(**sample_user_data())
-    replier_two = User(**sample_user_data())
-    session.add_all([replier_one, replier_two])
-    session.commit()
+    # make_users 内部 commit 会把 parent_comment 一并落库
+    replier_one, replier_two = make_users(2)
     session.refresh(parent_comment)
 
     notification = notification_crud.create_or_update_notification(
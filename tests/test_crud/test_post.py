@@ -11,8 +11,11 @@ tests/test_crud/test_post.py
 """
 
 import uuid
+from collections.abc import Generator
+from contextlib import contextmanager
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 import app.crud.post as post_crud
@@ -23,6 +26,31 @@ from app.models.user import User
 from app.schemas.post import PostCreate, PostUpdate
 
 
+@contextmanager
+def _capture_statements(session: Session) -> Generator[list[str], None, None]:
+    """捕获代码块内发出的 SQL 语句，用于断言查询次数
+
+    防止 CRUD 查询在重构时悄悄退化成多次往返或 Python 侧排序。
+    """
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        # 过滤测试隔离用的 SAVEPOINT/RELEASE 等事务指令，只统计真实查询
+        if (
+            statement.lstrip()
+            .upper()
+            .startswith(("SELECT", "INSERT", "UPDATE", "DELETE"))
+        ):
+            statements.append(statement)
+
+    bind = session.get_bind()
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)
+
+
 class TestCRUDPost:
     """测试 Post CRUD 的所有方法"""
 
@@ -68,66 +96,62 @@ class TestCRUDPost:
         assert new_tag_from_db is not None
         assert new_tag_from_db.slug is not None
 
-    def test_create_post_with_empty_tags(self, session: Session, sample_user: User):
-        """✅ 边界数据：测试创建文章时标签为空列表"""
-        post_in = PostCreate(
-            title="Test Post Empty Tags",
-            content="Content here...",
-            tags=[],
-        )
-
-        created_post = post_crud.create_post(
-            db=session, post_in=post_in, author_id=sample_user.id
-        )
-
-        assert created_post.title == "Test Post Empty Tags"
-        assert len(created_post.tags) == 0
+    @pytest.mark.parametrize(
+        ("title", "tags", "slug", "expected_slug"),
+        [
+            pytest.param(
+                "Test Post Empty Tags",
+                [],
+                None,
+                "Test-Post-Empty-Tags",
+                id="empty_tags",
+            ),
+            pytest.param(
+                "Test Post None Tags",
+                None,
+                None,
+                "Test-Post-None-Tags",
+                id="none_tags",
+            ),
+            # 不提供 slug 时根据 title 自动生成
+            pytest.param("Test Post", None, None, "Test-Post", id="auto_slug"),
+            pytest.param(
+                "Test Post",
+                None,
+                "custom-slug-123",
+                "custom-slug-123",
+                id="custom_slug",
+            ),
+        ],
+    )
+    def test_create_post_variants(
+        self,
+        session: Session,
+        sample_user: User,
+        title: str,
+        tags: list[str] | None,
+        slug: str | None,
+        expected_slug: str,
+    ):
+        """✅ 边界数据：标签为空/None、slug 自动生成/自定义 的创建变体
 
-    def test_create_post_with_none_tags(self, session: Session, sample_user: User):
-        """✅ 边界数据：测试创建文章时标签为 None"""
+        四个原本近乎相同的测试（空标签、None 标签、自动 slug、
+        自定义 slug）合并为一个参数化测试。
+        """
         post_in = PostCreate(
-            title="Test Post None Tags",
+            title=title,
             content="Content here...",
-            tags=None,
+            tags=tags,
+            slug=slug,
         )
 
         created_post = post_crud.create_post(
             db=session, post_in=post_in, author_id=sample_user.id
         )
 
-        assert created_post.title == "Test Post None Tags"
+        assert created_post.title == title
         assert len(created_post.tags) == 0
-
-    def test_create_post_auto_generate_slug(self, session: Session, sample_user: User):
-        """✅ 正常数据：测试自动生成 slug"""
-        post_in = PostCreate(
-            title="Test Post",
-            content="test content",
-            # 不提供 slug
-        )
-
-        created_post = post_crud.create_post(
-            db=session, post_in=post_in, author_id=sample_user.id
-        )
-
-        assert created_post.slug is not None
-        assert len(created_post.slug) > 0
-        assert created_post.slug == "Test-Post"  # slug 应该被处理过
-
-    def test_create_post_with_custom_slug(self, session: Session, sample_user: User):
-        """✅ 正常数据：测试使用自定义 slug"""
-        custom_slug = "custom-slug-123"
-        post_in = PostCreate(
-            title="Test Post",
-            content="Content",
-            slug=custom_slug,
-        )
-
-        created_post = post_crud.create_post(
-            db=session, post_in=post_in, author_id=sample_user.id
-        )
-
-        assert created_post.slug == custom_slug
+        assert created_post.slug == expected_slug
 
     def test_create_post_duplicate_slug(self, session: Session, sample_user: User):
         """✅ 异常数据：测试重复 slug 冲突"""
@@ -216,12 +240,20 @@ class TestCRUDPost:
         ⚠️使用 conftest.py 中的 sample_posts 数据
         """
 
-        # 调用 get_user_drafts(user_id)
-        drafts = post_crud.get_user_drafts(db=session, user_id=sample_user.id)
+        # 提前取出 id，避免访问过期属性的 refresh 查询混入统计
+        user_id = sample_user.id
+
+        # 调用 get_user_drafts(user_id)，同时捕获实际发出的 SQL
+        with _capture_statements(session) as statements:
+            drafts = post_crud.get_user_drafts(db=session, user_id=user_id)
+
         # 1. 断言只返回草稿文章
         assert any(post.status == PostStatus.DRAFT for post in drafts)
         # 2. 断言按创建时间倒序排列
         assert drafts == sorted(drafts, key=lambda x: x.created_at, reverse=True)
+        # 3. 断言只有一次查询往返，且排序发生在数据库侧
+        assert len(statements) == 1
+        assert "ORDER BY" in statements[0]
 
     def test_get_user_drafts_empty(self, session: Session, sample_user: User):
         """✅ 边界数据：测试用户无草稿时返回空列表"""
@@ -26,6 +26,26 @@ from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
 
+def _insert_user(
+    session: Session,
+    *,
+    email: str = "test@example.com",
+    username: str = "testuser",
+    password_hash: str = "hashed_password_123",
+) -> User:
+    """直接插入一行用户记录
+
+    查询/更新/删除/认证类测试只需要"库里有一个用户"，
+    直接建 ORM 行即可，跳过 create_user 的验证码校验和 bcrypt 哈希。
+    需要真实可验证密码的测试传入 known_password_hash 的哈希。
+    """
+    user = User(username=username, email=email, password_hash=password_hash)
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    return user
+
+
 def test_create_user(session: Session) -> None:
     """测试：成功创建一个新用户"""
     # 准备测试数据
@@ -49,10 +69,8 @@ def test_create_user(session: Session) -> None:
 def test_get_user_by_email(session: Session) -> None:
     """测试：通过邮箱获取用户"""
     email = "test@example.com"
-    password = "TestPassword123"
     username = "testuser"
-    user_in = UserCreate(email=email, password=password, username=username)
-    crud.user.create_user(db=session, user_in=user_in)
+    _insert_user(session, email=email, username=username)
 
     # 执行查询操作
     user: User | None = crud.user.get_user_by_email(db=session, email=email)
@@ -106,10 +124,7 @@ def test_create_user_with_duplicate_username(session: Session) -> None:
 
 def test_get_user_by_id(session: Session) -> None:
     """测试：通过用户 ID 查询用户"""
-    user_in = UserCreate(
-        email="test@example.com", password="TestPassword123", username="testuser"
-    )
-    created_user = crud.user.create_user(db=session, user_in=user_in)
+    created_user = _insert_user(session)
 
     # 通过 ID 查询
     user = crud.user.get_user_by_id(db=session, user_id=created_user.id)
@@ -131,10 +146,7 @@ def test_get_user_by_non_existent_id(session: Session) -> None:
 def test_get_user_by_username(session: Session) -> None:
     """测试：通过用户名查询用户"""
     username = "testuser"
-    user_in = UserCreate(
-        email="test@example.com", password="TestPassword123", username=username
-    )
-    crud.user.create_user(db=session, user_in=user_in)
+    _insert_user(session, username=username)
 
     user = crud.user.get_user_by_username(db=session, username=username)
 
@@ -154,10 +166,7 @@ def test_get_user_by_non_existent_username(session: Session) -> None:
 def test_update_user_partial(session: Session) -> None:
     """测试：部分更新用户信息（只更新提供的字段）"""
     # 创建用户
-    user_in = UserCreate(
-        email="test@example.com", password="TestPassword123", username="testuser"
-    )
-    user = crud.user.create_user(db=session, user_in=user_in)
+    user = _insert_user(session)
     original_email = user.email
     original_password_hash = user.password_hash
 
@@ -173,21 +182,21 @@ def test_update_user_partial(session: Session) -> None:
     assert updated_user.password_hash == original_password_hash  # 密码未变
 
 
-def test_update_user_password(session: Session) -> None:
-    """测试：更新用户密码（需要哈希处理）"""
-    # 创建用户
-    old_password = "OldPassword123"
-    user_in = UserCreate(
-        email="test@example.com", password=old_password, username="testuser"
-    )
-    user: User = crud.user.create_user(db=session, user_in=user_in)
-    old_password_hash = user.password_hash
-    print(repr(user))
+def test_update_user_password(
+    session: Session, known_password_hash: tuple[str, str]
+) -> None:
+    """测试：更新用户密码（需要哈希处理）
+
+    说明：旧密码校验已上移到 API 层，update_password 只负责哈希并落库。
+    """
+    # 创建用户（带真实可验证的旧密码哈希）
+    old_password, old_password_hash = known_password_hash
+    user = _insert_user(session, password_hash=old_password_hash)
 
     # 更新密码
     new_password = "NewPassword456"
     updated_user = crud.user.update_password(
-        db=session, user=user, old_password=old_password, new_password=new_password
+        db=session, user=user, new_password=new_password
     )
 
     assert updated_user is not None
@@ -212,10 +221,7 @@ def test_update_non_existent_user(session: Session) -> None:
 def test_delete_user(session: Session) -> None:
     """测试：软删除用户（设置 deleted_at）"""
     # 创建用户
-    user_in = UserCreate(
-        email="test@example.com", password="TestPassword123", username="testuser"
-    )
-    user: User = crud.user.create_user(db=session, user_in=user_in)
+    user = _insert_user(session)
     user_id = user.id
 
     # 软删除用户
@@ -234,10 +240,7 @@ def test_delete_non_existent_user(session: Session) -> None:
 def test_soft_deleted_user_not_queryable(session: Session) -> None:
     """测试：软删除的用户无法通过查询函数获取"""
     # 创建并删除用户
-    user_in = UserCreate(
-        email="test@example.com", password="TestPassword123", username="testuser"
-    )
-    user = crud.user.create_user(db=session, user_in=user_in)
+    user = _insert_user(session)
     user_id = user.id
     email = user.email
     username = user.username
@@ -253,12 +256,13 @@ def test_soft_deleted_user_not_queryable(session: Session) -> None:
 # ============ 认证测试：authenticate_user ============
 
 
-def test_authenticate_user_success(session: Session) -> None:
+def test_authenticate_user_success(
+    session: Session, known_password_hash: tuple[str, str]
+) -> None:
     """测试：使用正确的邮箱和密码认证成功"""
     email = "test@example.com"
-    password = "TestPassword123"
-    user_in = UserCreate(email=email, password=password, username="testuser")
-    crud.user.create_user(db=session, user_in=user_in)
+    password, password_hash = known_password_hash
+    _insert_user(session, email=email, password_hash=password_hash)
 
     # 认证成功
     user: User | None = crud.user.authenticate_user(
@@ -269,12 +273,13 @@ def test_authenticate_user_success(session: Session) -> None:
     assert user.email == email
 
 
-def test_authenticate_user_wrong_password(session: Session) -> None:
+def test_authenticate_user_wrong_password(
+    session: Session, known_password_hash: tuple[str, str]
+) -> None:
     """测试：错误的密码应该认证失败"""
     email = "test@example.com"
-    password = "CorrectPassword123"
-    user_in = UserCreate(email=email, password=password, username="testuser")
-    crud.user.create_user(db=session, user_in=user_in)
+    _, password_hash = known_password_hash
+    _insert_user(session, email=email, password_hash=password_hash)
 
     # 错误的密码
     user = crud.user.authenticate_user(
@@ -292,12 +297,13 @@ def test_authenticate_non_existent_user(session: Session) -> None:
     assert user is None
 
 
-def test_authenticate_soft_deleted_user(session: Session) -> None:
+def test_authenticate_soft_deleted_user(
+    session: Session, known_password_hash: tuple[str, str]
+) -> None:
     """测试：软删除的用户无法登录"""
     email = "test@example.com"
-    password = "TestPassword123"
-    user_in = UserCreate(email=email, password=password, username="testuser")
-    user = crud.user.create_user(db=session, user_in=user_in)
+    password, password_hash = known_password_hash
+    user = _insert_user(session, email=email, password_hash=password_hash)
 
     # 软删除用户
     crud.user.delete_user(db=session, user_id=user.id)